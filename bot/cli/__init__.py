@@ -14,6 +14,9 @@ Functions:
 - `show_all`: Displays all contacts in the address book.
 - `input_error`: Handles input-related errors by raising a custom exception.
 - `parse_input`: Parses the user's input into a command and a list of arguments.
+- `save_data`, `load_data`: Save the address book to a file and load it back.
+- `snapshot_generation`: Returns the generation of the saved snapshot, used to open the journal.
+- `open_journal`, `close_journal`: Start and stop logging changes made between saves.
 
 Example:
     Using the functions from this module to manage contacts:
@@ -27,4 +30,5 @@ Usage:
 from .handlers import show_help, add_contact, change_contact, show_phone, show_all
 from .input_error import input_error
 from .parse_input import parse_input
-from .data_manager import save_data, load_data
+from .data_manager import save_data, load_data, snapshot_generation
+from .journal import open_journal, close_journal
@@ -1,18 +1,148 @@
 """
-Модуль для збереження та відновлення об'єкта адресної книги за допомогою
-бібліотеки pickle.
+Модуль для збереження та відновлення об'єкта адресної книги.
+
+Адресна книга зберігається у компактному двійковому форматі:
+- заголовок: SAVE_MAGIC, номер покоління знімка (uint32) та кількість записів (uint32);
+- для кожного запису: довжина імені (uint16) та ім'я в UTF-8, кількість
+  телефонів (uint16), для кожного телефону довжина (uint8) та номер в UTF-8,
+  дата народження як порядковий номер дня date.toordinal() (uint32, 0 - не задана).
+
+Файли старих форматів (pickle та b"ABK1" без номера покоління) також завантажуються.
+
+Зміни, зроблені після останнього збереження, зберігаються в журналі
+(див. bot.cli.journal): load_data застосовує їх до завантаженої книги,
+а save_data очищує журнал після запису нового знімка. Кожне збереження
+збільшує номер покоління, тому журнал, який не встигли очистити, не
+застосовується до нового знімка повторно. load_data лише читає файли, а журнал
+відкривається для запису з номером покоління, який повертає snapshot_generation.
 
 Функції:
 - save_data(book: AddressBook, filename: str = "addressbook.pkl") -> None
+- snapshot_generation(filename: str = "addressbook.pkl") -> int
 - load_data(filename: str = "addressbook.pkl") -> AddressBook
 """
 
+import mmap
+import os
 import pickle
+import struct
+from datetime import date
+from typing import Tuple
+
+from bot.cli.journal import clear_journal, replay_journal
+from bot.models import Record
 from bot.models.address_book import AddressBook
 
+SAVE_MAGIC = b"ABK2"
+_SAVE_MAGIC_V1 = b"ABK1"
+
+_HEADER = struct.Struct("<II")
+_HEADER_V1 = struct.Struct("<I")
+_NAME_LEN = struct.Struct("<H")
+_PHONE_COUNT = struct.Struct("<H")
+_PHONE_LEN = struct.Struct("<B")
+_BIRTHDAY = struct.Struct("<I")
+
+def _encode(book: AddressBook, generation: int) -> bytearray:
+    """
+    Кодує адресну книгу у двійковий формат.
+
+    Параметри:
+    - book (AddressBook): Об'єкт адресної книги.
+    - generation (int): Номер покоління знімка.
+
+    Повертає:
+    - bytearray: Закодовані дані разом із заголовком.
+    """
+    buf = bytearray(SAVE_MAGIC)
+    buf += _HEADER.pack(generation, len(book))
+
+    for record in book.values():
+        name_bytes = record.name.value.encode("utf-8")
+        buf += _NAME_LEN.pack(len(name_bytes))
+        buf += name_bytes
+
+        buf += _PHONE_COUNT.pack(len(record.phones))
+        for phone in record.phones:
+            phone_bytes = phone.value.encode("utf-8")
+            buf += _PHONE_LEN.pack(len(phone_bytes))
+            buf += phone_bytes
+
+        birthday_ord = record.birthday.value.toordinal() if record.birthday else 0
+        buf += _BIRTHDAY.pack(birthday_ord)
+
+    return buf
+
+def _decode(data: memoryview) -> Tuple[AddressBook, int]:
+    """
+    Декодує адресну книгу з двійкового формату.
+
+    Дані у файлі вже пройшли валідацію під час додавання, тому записи
+    створюються через Record.from_values без повторної перевірки.
+
+    Параметри:
+    - data (memoryview): Вміст файлу разом із заголовком.
+
+    Повертає:
+    - Tuple[AddressBook, int]: Відновлений об'єкт адресної книги та номер
+    покоління знімка (0 для формату b"ABK1").
+    """
+    book = AddressBook()
+    offset = len(SAVE_MAGIC)
+    if data[:offset] == _SAVE_MAGIC_V1:
+        generation = 0
+        (count,) = _HEADER_V1.unpack_from(data, offset)
+        offset += _HEADER_V1.size
+    else:
+        generation, count = _HEADER.unpack_from(data, offset)
+        offset += _HEADER.size
+
+    for _ in range(count):
+        (name_len,) = _NAME_LEN.unpack_from(data, offset)
+        offset += _NAME_LEN.size
+        name = str(data[offset:offset + name_len], "utf-8")
+        offset += name_len
+
+        (phone_count,) = _PHONE_COUNT.unpack_from(data, offset)
+        offset += _PHONE_COUNT.size
+        phones = []
+        for _ in range(phone_count):
+            (phone_len,) = _PHONE_LEN.unpack_from(data, offset)
+            offset += _PHONE_LEN.size
+            phones.append(str(data[offset:offset + phone_len], "utf-8"))
+            offset += phone_len
+
+        (birthday_ord,) = _BIRTHDAY.unpack_from(data, offset)
+        offset += _BIRTHDAY.size
+        birthday = date.fromordinal(birthday_ord) if birthday_ord else None
+
+        record = Record.from_values(name, phones, birthday)
+        book.add_record(record)
+
+    return book, generation
+
+def snapshot_generation(filename: str = "addressbook.pkl") -> int:
+    """
+    Повертає номер покоління знімка, збереженого у файлі.
+
+    Параметри:
+    - filename (str): Назва файлу знімка.
+
+    Повертає:
+    - int: Номер покоління або 0, якщо файлу немає чи він старого формату.
+    """
+    if not os.access(filename, os.F_OK):
+        return 0
+
+    with open(filename, "rb") as f:
+        head = f.read(len(SAVE_MAGIC) + _HEADER.size)
+    if len(head) < len(SAVE_MAGIC) + _HEADER.size or not head.startswith(SAVE_MAGIC):
+        return 0
+    return _HEADER.unpack_from(head, len(SAVE_MAGIC))[0]
+
 def save_data(book: AddressBook, filename: str = "addressbook.pkl") -> None:
     """
-    Зберігає об'єкт адресної книги у файл за допомогою pickle.
+    Зберігає об'єкт адресної книги у файл у двійковому форматі.
 
     Параметри:
     - book (AddressBook): Об'єкт адресної книги, який потрібно зберегти.
@@ -21,23 +151,62 @@ def save_data(book: AddressBook, filename: str = "addressbook.pkl") -> None:
     Повертає:
     - None: Функція не повертає значення.
     """
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
+    generation = snapshot_generation(filename) + 1
+    data = _encode(book, generation)
+
+    # Дані спочатку записуються у тимчасовий файл, який потім атомарно
+    # замінює основний, тому збій під час запису не пошкодить попереднє збереження
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_filename, filename)
+    # Якщо збій станеться до очищення, журнал лишиться зі старим номером
+    # покоління і не буде застосований до нового знімка
+    clear_journal(filename, generation)
+
+def _load_snapshot(filename: str) -> Tuple[AddressBook, int]:
+    """
+    Завантажує збережений знімок адресної книги без змін із журналу.
+
+    Параметри:
+    - filename (str): Назва файлу знімка.
+
+    Повертає:
+    - Tuple[AddressBook, int]: Завантажений об'єкт адресної книги (або новий, якщо
+    файл не знайдено чи він порожній) та номер покоління знімка.
+    """
+    # os.access перевіряє наявність файлу без створення винятку, на відміну
+    # від os.path.exists та обробки FileNotFoundError
+    if not os.access(filename, os.F_OK):
+        return AddressBook(), 0
+
+    with open(filename, "rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return AddressBook(), 0
+
+        # Файл відображається у пам'ять і розбирається напряму, без копіювання у bytes
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(SAVE_MAGIC)] not in (SAVE_MAGIC, _SAVE_MAGIC_V1):
+                return pickle.load(mm), 0
+
+            with memoryview(mm) as view:
+                return _decode(view)
 
 def load_data(filename: str = "addressbook.pkl") -> AddressBook:
     """
-    Завантажує об'єкт адресної книги з файлу за допомогою pickle.
+    Завантажує об'єкт адресної книги з файлу та застосовує до нього зміни з журналу.
+    Файли старого формату завантажуються за допомогою pickle.
 
     Параметри:
     - filename (str): Назва файлу, з якого буде завантажено об'єкт. За замовчуванням
     "addressbook.pkl".
 
     Повертає:
-    - AddressBook: Завантажений об'єкт адресної книги. Якщо файл не знайдено,
-    створюється новий об'єкт AddressBook.
-    """
-    try:
-        with open(filename, "rb") as f:
-            return pickle.load(f)
-    except FileNotFoundError:
-        return AddressBook()
+    - AddressBook: Завантажений об'єкт адресної книги. Якщо файл не знайдено
+    або він порожній, створюється новий об'єкт AddressBook.
+    """
+    book, generation = _load_snapshot(filename)
+    replay_journal(book, filename, generation)
+    return book
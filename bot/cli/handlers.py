@@ -27,12 +27,14 @@ Functions:
 Usage:
 This module can be imported and used in other Python scripts to manage a collection
 of contacts. Each function handles specific operations related to adding, updating,
-and retrieving contact information.
+and retrieving contact information. Changes are recorded in the journal
+(see bot.cli.journal) so they survive until the next save.
 """
 
 from typing import List
 from bot.models import AddressBook, Record
 from bot.cli.input_error import input_error
+from bot.cli.journal import log_add_birthday, log_add_phone, log_edit_phone
 
 def show_help() -> None:
     """
@@ -82,11 +84,13 @@ def add_contact(args: List[str], address_book: AddressBook) -> str:
         if record.find_phone(phone_str):
             return f"Contact {name_str} already has this phone number."
         record.add_phone(phone_str)
+        log_add_phone(name_str, phone_str)
         return f"Phone number added to existing contact {name_str}."
 
     record = Record(name_str)
     record.add_phone(phone_str)
     address_book.add_record(record)
+    log_add_phone(name_str, phone_str)
     return "Contact added."
 
 @input_error
@@ -115,6 +119,7 @@ def change_contact(args: List[str], address_book: AddressBook) -> str:
         return f"No phone number {old_phone_str} found for contact {name_str}."
 
     record.edit_phone(old_phone_str, new_phone_str)
+    log_edit_phone(name_str, old_phone_str, new_phone_str)
     return "Contact updated."
 
 @input_error
@@ -152,7 +157,7 @@ def show_all(address_book: AddressBook) -> str:
     Returns:
     str: All contacts in the address book or a message indicating it's empty.
     """
-    if not address_book.data:
+    if not address_book:
         return "No contacts."
 
     return str(address_book)
@@ -179,11 +184,13 @@ def add_birthday(args: List[str], address_book: AddressBook) -> str:
 
     if record:
         record.add_birthday(birthday_str)
+        log_add_birthday(name_str, birthday_str)
         return f"Birthday added to existing contact {name_str}."
 
     record = Record(name_str)
     record.add_birthday(birthday_str)
     address_book.add_record(record)
+    log_add_birthday(name_str, birthday_str)
     return "Contact with birthday added."
 
 @input_error
@@ -221,7 +228,7 @@ def birthdays(address_book: AddressBook) -> str:
     Returns:
     str: A list of upcoming birthdays or a message indicating there are no contacts.
     """
-    if not address_book.data:
+    if not address_book:
         return "No contacts."
 
     return address_book.get_upcoming_birthdays()
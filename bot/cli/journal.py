@@ -0,0 +1,293 @@
+"""
+This module provides an append-only journal of address book changes.
+
+Every change made through the CLI handlers is appended to "<filename>.log" as
+a one-byte opcode followed by its arguments as length-prefixed UTF-8 strings.
+On startup the journal is replayed on top of the last saved snapshot, and it is
+cleared whenever a new snapshot is written, so changes survive a crash without
+rewriting the whole address book after every command.
+
+The journal starts with the generation (uint32) of the snapshot it extends.
+Each save bumps the snapshot generation, so a journal left behind by a crash
+between writing the snapshot and clearing the journal is recognised as stale
+and is not replayed a second time.
+
+Functions:
+- open_journal(generation: int, filename: str = "addressbook.pkl") -> None:
+  Opens the journal for appending, starting it anew or cutting off a torn tail.
+- close_journal() -> None:
+  Closes the journal.
+- log_add_phone(name: str, phone: str) -> None:
+  Records a phone number added to a contact.
+- log_edit_phone(name: str, old_phone: str, new_phone: str) -> None:
+  Records a phone number replaced in a contact.
+- log_add_birthday(name: str, birthday: str) -> None:
+  Records a birthday added to a contact.
+- replay_journal(book: AddressBook, filename: str, generation: int) -> int:
+  Applies the logged changes to an address book.
+- clear_journal(filename: str, generation: int) -> None:
+  Starts an empty journal for the snapshot of the given generation.
+"""
+
+import os
+import struct
+from typing import BinaryIO, List, Optional, Tuple
+
+from bot.models import AddressBook, Record
+
+OP_ADD_PHONE = 1
+OP_EDIT_PHONE = 2
+OP_ADD_BIRTHDAY = 3
+
+_FIELD_COUNTS = {
+    OP_ADD_PHONE: 2,
+    OP_EDIT_PHONE: 3,
+    OP_ADD_BIRTHDAY: 2,
+}
+
+_GENERATION = struct.Struct("<I")
+_OPCODE = struct.Struct("<B")
+_STR_LEN = struct.Struct("<H")
+
+_journal_file: Optional[BinaryIO] = None
+
+def _journal_path(filename: str) -> str:
+    """
+    Returns the path of the journal that belongs to the given snapshot file.
+    """
+    return filename + ".log"
+
+def _read_journal(filename: str, generation: int) -> Optional[bytes]:
+    """
+    Reads the journal of the given snapshot file.
+
+    Args:
+        filename (str): The snapshot file the journal belongs to.
+        generation (int): The generation of the snapshot on disk.
+
+    Returns:
+        Optional[bytes]: The journal contents, or None if the journal is missing
+        or stamped with another generation, i.e. belongs to an older snapshot.
+    """
+    path = _journal_path(filename)
+    # Checked up front so a missing journal does not raise on every start
+    if not os.access(path, os.F_OK):
+        return None
+
+    with open(path, "rb", buffering=0) as f:
+        data = f.read()
+
+    if len(data) < _GENERATION.size or _GENERATION.unpack_from(data)[0] != generation:
+        return None
+    return data
+
+def _parse(data: bytes) -> Tuple[List[Tuple[int, List[str]]], int]:
+    """
+    Splits journal contents into entries.
+
+    Parsing stops at a partially written entry, left by a crash in the middle of
+    a write, or at an unknown opcode. Complete entries whose text is not valid
+    UTF-8 are skipped.
+
+    Args:
+        data (bytes): The journal contents, including the generation header.
+
+    Returns:
+        Tuple[List[Tuple[int, List[str]]], int]: The (opcode, fields) entries and
+        the offset right after the last complete entry.
+    """
+    entries: List[Tuple[int, List[str]]] = []
+    offset = _GENERATION.size
+    size = len(data)
+
+    while offset + _OPCODE.size <= size:
+        (opcode,) = _OPCODE.unpack_from(data, offset)
+        field_count = _FIELD_COUNTS.get(opcode)
+        if field_count is None:
+            break
+
+        pos = offset + _OPCODE.size
+        raw_fields: List[bytes] = []
+        for _ in range(field_count):
+            if pos + _STR_LEN.size > size:
+                return entries, offset
+            (length,) = _STR_LEN.unpack_from(data, pos)
+            pos += _STR_LEN.size
+            if pos + length > size:
+                return entries, offset
+            raw_fields.append(data[pos:pos + length])
+            pos += length
+
+        try:
+            entries.append((opcode, [field.decode("utf-8") for field in raw_fields]))
+        except UnicodeDecodeError:
+            pass
+        offset = pos
+
+    return entries, offset
+
+def open_journal(generation: int, filename: str = "addressbook.pkl") -> None:
+    """
+    Opens the journal of the given snapshot file for appending.
+
+    A missing journal, or one left from an older snapshot, is started anew.
+    Anything after the last complete entry is cut off, so new entries are
+    never appended to a torn or unreadable tail.
+
+    Args:
+        generation (int): The generation of the snapshot on disk.
+        filename (str): The snapshot file the journal belongs to.
+    """
+    global _journal_file
+    close_journal()
+
+    data = _read_journal(filename, generation)
+    if data is None:
+        clear_journal(filename, generation)
+    else:
+        _, end = _parse(data)
+        if end < len(data):
+            os.truncate(_journal_path(filename), end)
+
+    # Unbuffered, so every entry reaches the file in a single write
+    _journal_file = open(_journal_path(filename), "ab", buffering=0)
+
+def close_journal() -> None:
+    """
+    Closes the journal if it is open. Later changes are no longer logged.
+    """
+    global _journal_file
+    if _journal_file is not None:
+        _journal_file.close()
+        _journal_file = None
+
+def _write(opcode: int, *fields: str) -> None:
+    """
+    Appends an entry to the open journal. Does nothing if no journal is open.
+
+    Args:
+        opcode (int): The kind of change.
+        *fields (str): The arguments of the change.
+    """
+    if _journal_file is None:
+        return
+
+    buf = bytearray(_OPCODE.pack(opcode))
+    for field in fields:
+        field_bytes = field.encode("utf-8")
+        buf += _STR_LEN.pack(len(field_bytes))
+        buf += field_bytes
+    _journal_file.write(buf)
+
+def log_add_phone(name: str, phone: str) -> None:
+    """
+    Records that a phone number was added to a contact, creating it if needed.
+
+    Args:
+        name (str): The name of the contact.
+        phone (str): The added phone number.
+    """
+    _write(OP_ADD_PHONE, name, phone)
+
+def log_edit_phone(name: str, old_phone: str, new_phone: str) -> None:
+    """
+    Records that a phone number of a contact was replaced.
+
+    Args:
+        name (str): The name of the contact.
+        old_phone (str): The replaced phone number.
+        new_phone (str): The new phone number.
+    """
+    _write(OP_EDIT_PHONE, name, old_phone, new_phone)
+
+def log_add_birthday(name: str, birthday: str) -> None:
+    """
+    Records that a birthday was added to a contact, creating it if needed.
+
+    Args:
+        name (str): The name of the contact.
+        birthday (str): The birthday in the format DD.MM.YYYY.
+    """
+    _write(OP_ADD_BIRTHDAY, name, birthday)
+
+def _apply(book: AddressBook, opcode: int, fields: List[str]) -> None:
+    """
+    Applies a single journal entry to the address book.
+
+    Args:
+        book (AddressBook): The address book to update.
+        opcode (int): The kind of change.
+        fields (List[str]): The arguments of the change.
+
+    Raises:
+        ValueError: If the entry cannot be applied, e.g. holds an invalid value.
+    """
+    name = fields[0]
+    record = book.find(name)
+
+    if opcode == OP_EDIT_PHONE:
+        old_phone, new_phone = fields[1:]
+        if record and record.find_phone(old_phone):
+            record.edit_phone(old_phone, new_phone)
+        return
+
+    is_new = record is None
+    if is_new:
+        record = Record(name)
+
+    if opcode == OP_ADD_PHONE:
+        record.add_phone(fields[1])
+    elif opcode == OP_ADD_BIRTHDAY:
+        if record.birthday is None:
+            record.add_birthday(fields[1])
+
+    # Added only once the change succeeded, so a rejected entry leaves no empty contact
+    if is_new:
+        book.add_record(record)
+
+def replay_journal(book: AddressBook, filename: str, generation: int) -> int:
+    """
+    Applies the changes logged since the last snapshot to the address book.
+
+    The journal is only read. A journal stamped with another generation belongs
+    to an older snapshot and is ignored. A torn tail is ignored too, and entries
+    that cannot be applied are skipped, so a damaged journal never makes the
+    address book unloadable.
+
+    Args:
+        book (AddressBook): The address book loaded from the snapshot.
+        filename (str): The snapshot file the journal belongs to.
+        generation (int): The generation of the loaded snapshot.
+
+    Returns:
+        int: The offset right after the last complete entry, or 0 if the
+        journal is missing or stale.
+    """
+    data = _read_journal(filename, generation)
+    if data is None:
+        return 0
+
+    entries, end = _parse(data)
+    for opcode, fields in entries:
+        try:
+            _apply(book, opcode, fields)
+        except ValueError:
+            pass
+
+    return end
+
+def clear_journal(filename: str, generation: int) -> None:
+    """
+    Drops all logged changes and stamps the journal with the generation of the
+    snapshot that now contains them.
+
+    The journal is truncated rather than removed, so an open journal keeps
+    appending to the same file.
+
+    Args:
+        filename (str): The snapshot file the journal belongs to.
+        generation (int): The generation of the snapshot on disk.
+    """
+    with open(_journal_path(filename), "ab", buffering=0) as f:
+        f.truncate(0)
+        f.write(_GENERATION.pack(generation))
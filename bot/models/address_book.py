@@ -2,11 +2,10 @@
 This module provides the AddressBook class, which is used to manage a collection of contact records.
 
 Classes:
-- AddressBook: A class that extends UserDict to manage a collection of contact records.
+- AddressBook: A class that extends dict to manage a collection of contact records.
 It supports adding, finding, and deleting contacts.
 
 Imports:
-- UserDict from collections: A dictionary-like class that allows extension and customization.
 - Record from .record: A class representing a contact record, which includes contact name
 and phone numbers.
 
@@ -24,13 +23,12 @@ Example:
     address_book.delete("John Doe")
 """
 
-from datetime import datetime, timedelta, date
-from typing import List, Dict, Optional
-from collections import UserDict
+from datetime import datetime, date
+from typing import Any, List, Dict, Optional
 
 from .record import Record
 
-class AddressBook(UserDict):
+class AddressBook(dict):
     """
     AddressBook is a collection of contact records that allows adding,
     finding, and deleting contacts.
@@ -45,10 +43,58 @@ class AddressBook(UserDict):
         delete(name: str) -> None:
             Deletes a record from the address book by the contact's name.
 
-        get_upcoming_birthdays() -> List[Dict[str, str]]:
-            Returns a list of upcoming birthdays within the next 7 days.
+        get_upcoming_birthdays(today_date: Optional[date] = None) -> str:
+            Returns the upcoming birthdays within the next 7 days.
+
+    The string representation is cached until the book or one of its records changes.
+    Only add_record and delete keep the cache up to date; the plain dict methods
+    (item assignment, pop, update and so on) bypass it. A record belongs to the first
+    book it is added to, and the cache is used only while the book owns all of its
+    records, since changes to records owned by another book are reported there.
     """
 
+    # Stores into a slot are much cheaper than into the __dict__ of a dict subclass,
+    # which matters for the cache bookkeeping in add_record
+    __slots__ = ("_str_cache", "_owned")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initializes an address book, optionally filled like a regular dict.
+        """
+        self._str_cache: Optional[str] = None
+        self._owned = 0
+        super().__init__(*args, **kwargs)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores an address book from pickled state. Books pickled by older versions
+        were based on UserDict and kept their records in the `data` attribute.
+
+        Args:
+            state (Dict[str, Any]): The pickled instance attributes. Pickles of the
+                slotted book store them as a (None, slots) pair instead.
+        """
+        self._str_cache = None
+        self._owned = 0
+        if isinstance(state, dict):
+            for record in state.get("data", {}).values():
+                self.add_record(record)
+            return
+
+        # pickle restores the items before the state, so unpickled records can be
+        # claimed here; copy restores them afterwards and leaves them unowned
+        for record in self.values():
+            if record._book is None:
+                record._book = self
+                self._owned += 1
+
+    def _invalidate_str_cache(self) -> None:
+        """
+        Drops the cached string representation. Called by records of this book
+        whenever they change.
+        """
+        self._str_cache = None
+
     def add_record(self, record: Record) -> None:
         """
         Adds a new record to the address book.
@@ -56,7 +102,18 @@ class AddressBook(UserDict):
         Args:
             record (Record): The record to be added.
         """
-        self.data[record.name.value] = record
+        name = record.name.value
+        replaced = self.get(name)
+        if replaced is not None and replaced._book is self:
+            replaced._book = None
+            self._owned -= 1
+
+        # AddressBook does not override __setitem__, so this stays on the C fast path
+        self[name] = record
+        if record._book is None:
+            record._book = self
+            self._owned += 1
+        self._str_cache = None
 
     def find(self, name: str) -> Optional[Record]:
         """
@@ -68,7 +125,7 @@ class AddressBook(UserDict):
         Returns:
             Optional[Record]: The found record or None if not found.
         """
-        return self.data.get(name, None)
+        return self.get(name, None)
 
     def delete(self, name: str) -> None:
         """
@@ -77,51 +134,23 @@ class AddressBook(UserDict):
         Args:
             name (str): The name of the contact to delete.
         """
-        if name in self.data:
-            del self.data[name]
-
-    def _is_date_within_days(self, target_date: datetime, days: int) -> bool:
-        """
-        Checks if the target date falls within the given number of days from today.
-
-        Args:
-            target_date (datetime): The target date to check.
-            days (int): The number of days to check within.
-
-        Returns:
-            bool: True if the target date is within the range, False otherwise.
+        record = self.pop(name, None)
+        if record is not None:
+            if record._book is self:
+                record._book = None
+                self._owned -= 1
+            self._str_cache = None
+
+    def get_upcoming_birthdays(self, today_date: Optional[date] = None) -> str:
         """
-        today_date = datetime.now().date()
-        date_this_year = date(today_date.year, target_date.month, target_date.day)
-
-        if date_this_year < today_date:
-            target_date = date(today_date.year + 1, target_date.month, target_date.day)
-        else:
-            target_date = date_this_year
+        Returns a formatted string of upcoming birthdays within the next 7 days.
 
-        return today_date <= target_date <= (today_date + timedelta(days=days))
-
-    def _adjust_to_weekday(self, date_obj: date) -> date:
-        """
-        Adjusts the date to the next weekday if it falls on a weekend.
+        Dates are compared as proleptic Gregorian ordinals, so only the matching
+        birthdays are turned back into date objects for formatting.
 
         Args:
-            date_obj (date): The date to adjust.
-
-        Returns:
-            date: The adjusted date.
-        """
-        if date_obj.weekday() == 5:  # Saturday
-            return date_obj + timedelta(days=2)
-
-        if date_obj.weekday() == 6:  # Sunday
-            return date_obj + timedelta(days=1)
-
-        return date_obj
-
-    def get_upcoming_birthdays(self) -> str:
-        """
-        Returns a formatted string of upcoming birthdays within the next 7 days.
+            today_date (Optional[date]): The date to count from. Defaults to the
+                current date, which is then read only once per call.
 
         Returns:
             str: A formatted string containing the name and birthday date of contacts
@@ -130,25 +159,31 @@ class AddressBook(UserDict):
         upcoming_birthdays_list = []
         days = 7
 
-        today_date = datetime.now().date()
+        if today_date is None:
+            today_date = datetime.now().date()
+        today_ord = today_date.toordinal()
+        year = today_date.year
 
-        for record in self.data.values():
+        for record in self.values():
             if record.birthday:
                 try:
                     user_birthday = record.birthday.value
-
-                    if self._is_date_within_days(user_birthday, days):
-                        month = user_birthday.month
-                        day = user_birthday.day
-                        birthday_this_year = date(today_date.year, month, day)
-
-                        if birthday_this_year < today_date:
-                            congratulation_date = date(today_date.year + 1, month, day)
-                        else:
-                            congratulation_date = birthday_this_year
-
-                        congratulation_date = self._adjust_to_weekday(congratulation_date)
-
+                    month = user_birthday.month
+                    day = user_birthday.day
+
+                    birthday_ord = date(year, month, day).toordinal()
+                    if birthday_ord < today_ord:
+                        birthday_ord = date(year + 1, month, day).toordinal()
+
+                    if birthday_ord - today_ord <= days:
+                        # toordinal() % 7 is 6 for Saturday and 0 for Sunday
+                        weekday = birthday_ord % 7
+                        if weekday == 6:
+                            birthday_ord += 2
+                        elif weekday == 0:
+                            birthday_ord += 1
+
+                        congratulation_date = date.fromordinal(birthday_ord)
                         upcoming_birthdays_list.append(
                             f"Contact name: {record.name.value}, birthday: {congratulation_date.strftime('%d.%m.%Y')}"
                         )
@@ -165,4 +200,10 @@ class AddressBook(UserDict):
         Returns:
             str: A string representing all records in the address book.
         """
-        return "\n".join(str(record) for record in self.data.values())
\ No newline at end of file
+        if self._str_cache is not None and self._owned == len(self):
+            return self._str_cache
+
+        text = "\n".join([str(record) for record in self.values()])
+        if self._owned == len(self):
+            self._str_cache = text
+        return text
\ No newline at end of file
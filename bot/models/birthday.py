@@ -14,9 +14,11 @@ birthday object. Ensure that the date string adheres to the expected format and
 represents a valid date in the past.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from .field import Field
 
+_BIRTHDAY_FORMAT = "%d.%m.%Y"
+
 class Birthday(Field):
     """
     Represents a birthday field in a contact management system.
@@ -35,6 +37,8 @@ class Birthday(Field):
     ValueError: If the date format is incorrect or if the date is in the future.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str) -> None:
         """
         Initialize a Birthday object with the provided date string.
@@ -46,7 +50,7 @@ class Birthday(Field):
         ValueError: If the date format is incorrect or if the date is in the future.
         """
         try:
-            birthday_date = datetime.strptime(value, "%d.%m.%Y")
+            birthday_date = datetime.strptime(value, _BIRTHDAY_FORMAT)
             if birthday_date > datetime.now():
                 raise ValueError("Birthday date cannot be in the future")
             self.value = birthday_date
@@ -55,3 +59,18 @@ class Birthday(Field):
                 raise ValueError("Invalid date format. Use DD.MM.YYYY") from exc
             raise
         super().__init__(birthday_date)
+
+    @classmethod
+    def from_date(cls, date_obj: date) -> "Birthday":
+        """
+        Create a Birthday from an already validated date, skipping string parsing.
+
+        Parameters:
+        date_obj (date): The birthday date.
+
+        Returns:
+        Birthday: A Birthday object storing the date as a datetime at midnight.
+        """
+        birthday = cls.__new__(cls)
+        birthday.value = datetime(date_obj.year, date_obj.month, date_obj.day)
+        return birthday
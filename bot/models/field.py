@@ -21,6 +21,8 @@ class Field:
             Returns a string representation of the field's value.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any) -> None:
         """
         Initializes a new Field instance with a given value.
@@ -38,3 +40,15 @@ class Field:
             str: The string representation of the field's value.
         """
         return str(self.value)
+
+    def __setstate__(self, state: Any) -> None:
+        """
+        Restores the field from pickled state. Fields pickled before the class used
+        __slots__ store a dict of attributes, slotted ones a (None, slots) pair.
+
+        Args:
+            state (Any): The pickled state.
+        """
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **state[1]}
+        self.value = state["value"]
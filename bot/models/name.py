@@ -6,7 +6,7 @@ The module includes:
 
 Classes:
 - `Name`: A subclass of `Field` that represents a contact's name. It ensures that the
-name is not empty.
+name is not empty and fits the length prefix used when saving.
 
 Usage:
 - Import the `Name` class to create and manage the name field in a contact record.
@@ -19,6 +19,8 @@ Example:
         print(name.value)
 """
 
+import sys
+
 from .field import Field
 
 class Name(Field):
@@ -26,12 +28,17 @@ class Name(Field):
     Represents the name field in a contact record.
 
     Attributes:
-    - value (str): The name value.
+    - value (str): The name value, interned since it is used as the address book key.
 
     Methods:
     - __init__: Initializes the Name instance and ensures the name is not empty.
     """
 
+    __slots__ = ()
+
+    # Names are stored with a uint16 length prefix in the snapshot and the journal
+    MAX_LENGTH = 0xFFFF
+
     def __init__(self, value: str) -> None:
         """
         Initializes the Name instance with a value.
@@ -40,8 +47,10 @@ class Name(Field):
         - value (str): The name value.
 
         Raises:
-        - ValueError: If the name is empty.
+        - ValueError: If the name is empty or longer than MAX_LENGTH bytes in UTF-8.
         """
         if not value:
             raise ValueError("Name cannot be empty")
-        super().__init__(value)
+        if len(value.encode("utf-8")) > self.MAX_LENGTH:
+            raise ValueError("Name is too long")
+        super().__init__(sys.intern(value))
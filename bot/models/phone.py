@@ -10,6 +10,8 @@ Usage:
 import re
 from .field import Field
 
+_PHONE_RE = re.compile(r'\d{10}')
+
 class Phone(Field):
     """
     A class representing a phone number with validation.
@@ -25,6 +27,8 @@ class Phone(Field):
             Initializes a new Phone instance with validation.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str) -> None:
         """
         Initializes a new Phone instance with a given value, ensuring it is a valid phone number.
@@ -35,7 +39,6 @@ class Phone(Field):
         Raises:
             ValueError: If the phone number does not consist of exactly 10 digits.
         """
-        if not re.fullmatch(r'\d{10}', value):
+        if not _PHONE_RE.fullmatch(value):
             raise ValueError("Phone number must be 10 digits")
         super().__init__(value)
-        
@@ -7,12 +7,17 @@ Classes:
 - Record: Represents a contact record with a name and a list of phone numbers.
 """
 
-from typing import List, Optional
+import sys
+from datetime import date
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from .name import Name
 from .phone import Phone
 from .birthday import Birthday
 
+if TYPE_CHECKING:
+    from .address_book import AddressBook
+
 class Record:
     """
     Represents a contact record with a name and a list of phone numbers.
@@ -20,8 +25,14 @@ class Record:
     Attributes:
     - name (Name): The contact's name.
     - phones (List[Phone]): A list of the contact's phone numbers.
+    - _phone_index (Dict[str, Phone]): The same phones keyed by their number. Each number
+    appears in the list at most once, so the list and the index always hold the same phones.
+    - _book (Optional[AddressBook]): The address book the record was added to.
+    - _str_cache (Optional[str]): The cached string representation of the record.
     """
 
+    __slots__ = ("name", "phones", "birthday", "_phone_index", "_book", "_str_cache")
+
     def __init__(self, name: str) -> None:
         """
         Initializes a new Record instance with a name.
@@ -31,17 +42,65 @@ class Record:
         """
         self.name = Name(name)
         self.phones: List[Phone] = []
+        self._phone_index: Dict[str, Phone] = {}
         self.birthday = None
+        self._book: Optional["AddressBook"] = None
+        self._str_cache: Optional[str] = None
+
+    @classmethod
+    def from_values(cls, name: str, phones: List[str], birthday: Optional[date]) -> "Record":
+        """
+        Creates a record from already validated values, e.g. when loading a saved
+        address book, without running the field validation again.
+
+        Args:
+        - name (str): The name of the contact.
+        - phones (List[str]): The contact's phone numbers.
+        - birthday (Optional[date]): The contact's birthday, if set.
+
+        Returns:
+        - Record: The new record, not yet added to an address book.
+        """
+        record = cls.__new__(cls)
+        record.name = Name.__new__(Name)
+        record.name.value = sys.intern(name)
+        record.phones = []
+        record._phone_index = {}
+        for phone_number in phones:
+            if phone_number in record._phone_index:
+                continue
+            phone = Phone.__new__(Phone)
+            phone.value = phone_number
+            record.phones.append(phone)
+            record._phone_index[phone_number] = phone
+        record.birthday = Birthday.from_date(birthday) if birthday is not None else None
+        record._book = None
+        record._str_cache = None
+        return record
+
+    def _changed(self) -> None:
+        """
+        Invalidates the cached string representations of the record and
+        of the owning address book.
+        """
+        self._str_cache = None
+        if self._book is not None:
+            self._book._invalidate_str_cache()
 
     def add_phone(self, phone_number: str) -> None:
         """
-        Adds a phone number to the contact's list of phone numbers.
+        Adds a phone number to the contact's list of phone numbers. A number the
+        contact already has is not added again.
 
         Args:
         - phone_number (str): The phone number to add.
         """
         phone = Phone(phone_number)
+        if phone_number in self._phone_index:
+            return
         self.phones.append(phone)
+        self._phone_index[phone_number] = phone
+        self._changed()
 
     def remove_phone(self, phone_number: str) -> None:
         """
@@ -50,19 +109,37 @@ class Record:
         Args:
         - phone_number (str): The phone number to remove.
         """
-        self.phones = [p for p in self.phones if p.value != phone_number]
+        phone = self._phone_index.pop(phone_number, None)
+        if phone is not None:
+            self.phones.remove(phone)
+            self._changed()
 
     def edit_phone(self, old_phone_number: str, new_phone_number: str) -> None:
         """
         Replaces an old phone number with a new phone number in the contact's list.
+        If the contact already has the new number, the old one is just removed.
 
         Args:
         - old_phone_number (str): The phone number to replace.
         - new_phone_number (str): The new phone number to add.
+
+        Raises:
+        - ValueError: If the old phone number is not in the contact's list.
         """
+        new_phone = Phone(new_phone_number)
+        phone = self._phone_index.get(old_phone_number)
+        if phone is None:
+            raise ValueError(f"Phone number {old_phone_number} not found")
+        if old_phone_number == new_phone_number:
+            return
 
-        self.add_phone(new_phone_number)
-        self.remove_phone(old_phone_number)
+        del self._phone_index[old_phone_number]
+        if new_phone_number in self._phone_index:
+            self.phones.remove(phone)
+        else:
+            self.phones[self.phones.index(phone)] = new_phone
+            self._phone_index[new_phone_number] = new_phone
+        self._changed()
 
     def find_phone(self, phone_number: str) -> Optional[Phone]:
         """
@@ -74,10 +151,27 @@ class Record:
         Returns:
         - Phone or None: The Phone instance if found, otherwise None.
         """
+        return self._phone_index.get(phone_number)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores the record from pickled state and rebuilds the phone index,
+        which records saved by older versions do not have.
+
+        Args:
+        - state (Dict[str, Any]): The pickled instance attributes. Pickles of slotted
+        records store them as a (None, slots) pair.
+        """
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **state[1]}
+        for attr, value in state.items():
+            setattr(self, attr, value)
+        self._phone_index = {}
         for phone in self.phones:
-            if phone.value == phone_number:
-                return phone
-        return None
+            self._phone_index.setdefault(phone.value, phone)
+        self.phones = list(self._phone_index.values())
+        self._book = None
+        self._str_cache = None
 
     def add_birthday(self, birthday: str) -> None:
         """
@@ -88,6 +182,7 @@ class Record:
         """
         if self.birthday is None:
             self.birthday = Birthday(birthday)
+            self._changed()
         else:
             raise ValueError("Birthday is already set")
 
@@ -109,13 +204,15 @@ class Record:
         Returns:
         - str: A string describing the contact's name and phone numbers.
         """
-        phones_str = '; '.join(str(p) for p in self.phones)
-        if not phones_str:
-            phones_str = "----------"
+        if self._str_cache is not None:
+            return self._str_cache
+
+        phones_str = '; '.join([phone.value for phone in self.phones]) or "----------"
 
         if self.birthday:
             birthday_str = self.birthday.value.strftime("%d.%m.%Y")
         else:
             birthday_str = "----------"
 
-        return f"Contact name: {self.name.value}, birthday: {birthday_str}, phones: {phones_str}"
+        self._str_cache = f"Contact name: {self.name.value}, birthday: {birthday_str}, phones: {phones_str}"
+        return self._str_cache
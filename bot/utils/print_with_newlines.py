@@ -21,6 +21,18 @@ Example:
     (empty line)
 """
 
+import sys
+
+_NEWLINES = tuple("\n" * n for n in range(4))
+
+def _newlines(count: int) -> str:
+    """
+    Returns a string of `count` newlines, reusing the precomputed ones when possible.
+    """
+    if 0 <= count < len(_NEWLINES):
+        return _NEWLINES[count]
+    return "\n" * count
+
 def print_with_newlines(content: str, lines_before: int = 1, lines_after: int = 1) -> None:
     """
     Prints content with a specified number of empty lines before and after the content.
@@ -43,4 +55,4 @@ def print_with_newlines(content: str, lines_before: int = 1, lines_after: int =
         Hello, World!
         (empty line)
     """
-    print("\n" * lines_before + content + "\n" * lines_after)
+    sys.stdout.write(f"{_newlines(lines_before)}{content}{_newlines(lines_after)}\n")
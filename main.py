@@ -40,13 +40,27 @@ The above block ensures that the main function runs only when the module is exec
 as a script, not when it is imported as a module.
 """
 
-from typing import List
+from typing import Callable, Dict, List
 
 from bot.cli import handlers
-from bot.cli.data_manager import load_data, save_data
+from bot.cli.data_manager import load_data, save_data, snapshot_generation
+from bot.cli.journal import close_journal, open_journal
 from bot.cli.parse_input import parse_input
+from bot.models import AddressBook
 from bot.utils import print_with_newlines
 
+COMMANDS: Dict[str, Callable[[AddressBook, List[str]], str]] = {
+    "help": lambda address_book, args: handlers.show_help(),
+    "hello": lambda address_book, args: "How can I help you?",
+    "add": lambda address_book, args: handlers.add_contact(args, address_book),
+    "change": lambda address_book, args: handlers.change_contact(args, address_book),
+    "phone": lambda address_book, args: handlers.show_phone(args, address_book),
+    "all": lambda address_book, args: handlers.show_all(address_book),
+    "add-birthday": lambda address_book, args: handlers.add_birthday(args, address_book),
+    "show-birthday": lambda address_book, args: handlers.show_birthday(args, address_book),
+    "birthdays": lambda address_book, args: handlers.birthdays(address_book),
+}
+
 def main() -> None:
     """
     Runs the assistant bot for managing contacts.
@@ -60,12 +74,14 @@ def main() -> None:
     - 'all' to display all contacts
     - 'help' to display available commands
 
-    Uses handlers from the 'handlers' module for contact management.
+    Commands are dispatched through the COMMANDS table, which maps each command
+    to a handler from the 'handlers' module.
 
     Returns:
     None
     """
     address_book = load_data()
+    open_journal(snapshot_generation())
 
     print_with_newlines("Welcome to the assistant bot!")
     print_with_newlines("Type 'help' to see a list of available commands.", lines_before = 0)
@@ -82,38 +98,15 @@ def main() -> None:
 
         if command in ["close", "exit"]:
             save_data(address_book)
+            close_journal()
             print_with_newlines("Good bye!")
             break
 
-        if command == "help":
-            print_with_newlines(handlers.show_help())
-
-        elif command == "hello":
-            print_with_newlines("How can I help you?")
-
-        elif command == "add":
-            print_with_newlines(handlers.add_contact(args, address_book))
-
-        elif command == "change":
-            print_with_newlines(handlers.change_contact(args, address_book))
-
-        elif command == "phone":
-            print_with_newlines(handlers.show_phone(args, address_book))
-
-        elif command == "all":
-            print_with_newlines(handlers.show_all(address_book))
-
-        elif command == "add-birthday":
-            print_with_newlines(handlers.add_birthday(args, address_book))
-
-        elif command == "show-birthday":
-            print_with_newlines(handlers.show_birthday(args, address_book))
-
-        elif command == "birthdays":
-            print_with_newlines(handlers.birthdays(address_book))
-
-        else:
+        handler = COMMANDS.get(command)
+        if handler is None:
             print_with_newlines("Invalid command.")
+        else:
+            print_with_newlines(handler(address_book, args))
 
 if __name__ == "__main__":
     main()